@@ -81,6 +81,7 @@ class RowNormalizer(object):
 
     def __init__(self, columns, style):
         self._columns = columns
+        self._col_to_idx = None  # column => index, for sequence rows
         self.method = None
 
         self.delayed = defaultdict(list)
@@ -102,6 +103,9 @@ class RowNormalizer(object):
                 self.nothings[column] = Nothing(cstyle["missing"])
             else:
                 self.nothings[column] = NOTHING
+        # Columns whose values are retrieved right away, in order.
+        self._undelayed_columns = tuple(
+            c for c in columns if c not in self.delayed_columns)
 
     def __call__(self, row):
         """Normalize `row`
@@ -121,9 +125,11 @@ class RowNormalizer(object):
         return self.method(row)
 
     def _choose_normalizer(self, row):
-        if isinstance(row, Mapping):
+        # Check the concrete types first to avoid the slower abstract base
+        # class checks in the common case.
+        if isinstance(row, dict) or isinstance(row, Mapping):
             getter = self.getter_dict
-        elif isinstance(row, Sequence):
+        elif isinstance(row, (list, tuple)) or isinstance(row, Sequence):
             getter = self.getter_seq
         else:
             getter = self.getter_attrs
@@ -132,7 +138,9 @@ class RowNormalizer(object):
 
     def _normalize(self, getter, row):
         columns = self._columns
-        if isinstance(row, Mapping):
+        # Check for a dict first to avoid the slower abstract base class check
+        # in the common case.
+        if isinstance(row, dict) or isinstance(row, Mapping):
             callables0 = self.strip_callables(row)
             # The row may have new columns.  All we're doing here is keeping
             # them around in the normalized row so that downstream code can
@@ -144,19 +152,32 @@ class RowNormalizer(object):
                     columns = list(self._columns)
                 columns = columns + new_cols
         else:
-            callables0 = []
+            callables0 = None
 
         norm_row = self._maybe_delay(getter, row, columns)
+        if callables0 is not None and not self.delayed:
+            # The callables have already been stripped from the mapping, and
+            # there are no delayed values, so norm_row can't have any.
+            return callables0, norm_row
         # We need a second pass with strip_callables because norm_row will
         # contain new callables for any delayed values.
         callables1 = self.strip_callables(norm_row)
-        return callables0 + callables1, norm_row
+        return (callables0 or []) + callables1, norm_row
 
     def _maybe_delay(self, getter, row, columns):
-        row_norm = {}
-        for column in columns:
-            if column not in self.delayed_columns:
-                row_norm[column] = getter(row, column)
+        if columns is self._columns:
+            undelayed = self._undelayed_columns
+        else:
+            delayed_columns = self.delayed_columns
+            undelayed = [c for c in columns if c not in delayed_columns]
+
+        if not self.delayed and getter == self.getter_seq \
+           and len(row) >= len(undelayed):
+            # The values are in column order, so pair them up directly rather
+            # than looking up each column's index.
+            row_norm = dict(zip(undelayed, row))
+        else:
+            row_norm = {column: getter(row, column) for column in undelayed}
 
         def delay(cols):
             return lambda: {c: getter(row, c) for c in cols}
@@ -226,7 +247,10 @@ class RowNormalizer(object):
         return row.get(column, self.nothings.get(column, NOTHING))
 
     def getter_seq(self, row, column):
-        col_to_idx = {c: idx for idx, c in enumerate(self._columns)}
+        col_to_idx = self._col_to_idx
+        if col_to_idx is None:
+            col_to_idx = self._col_to_idx = {
+                c: idx for idx, c in enumerate(self._columns)}
         return row[col_to_idx[column]]
 
     def getter_attrs(self, row, column):
@@ -244,6 +268,9 @@ class StyleFields(object):
         This instance is used to generate the fields from `style`.
     """
 
+    # Maximum number of distinct override styles to keep processors for.
+    _max_override_procs = 128
+
     def __init__(self, style, procgen):
         self.init_style = style
         self.procgen = procgen
@@ -257,9 +284,14 @@ class StyleFields(object):
         self.width_separtor = None
         self.fields = None
         self._truncaters = {}
+        # Available width used for the last _assign_widths() call.
+        self._width_auto_assigned = None
+        # (structural key of style, adopt) => {column: (pre, post)}
+        self._override_procs = {}
 
         self.hidden = {}  # column => {True, "if-empty", False}
         self._visible_columns = None  # cached list of visible columns
+        self._visible_fields = None  # cached (column, Field) pairs
 
         self._table_width = None
 
@@ -296,6 +328,7 @@ class StyleFields(object):
         self.style["width_"] = self._table_width
         elements.validate(self.style)
 
+        self._override_procs = {}
         self._setup_fields()
 
         self.hidden = {c: self.style[c]["hide"] for c in columns}
@@ -450,6 +483,7 @@ class StyleFields(object):
         """Reset visibility-dependent information.
         """
         self._visible_columns = None
+        self._visible_fields = None
         self._set_fixed_widths()
         self._check_widths()
 
@@ -468,6 +502,8 @@ class StyleFields(object):
         True if any widths required adjustment.
         """
         autowidth_columns = self.autowidth_columns
+        if not autowidth_columns:
+            return False
         fields = self.fields
 
         width_table = self.style["width_"]
@@ -477,45 +513,59 @@ class StyleFields(object):
         else:
             width_auto = width_table - width_fixed
 
-        if not autowidth_columns:
-            return False
-
         # Check what width each row wants.
         lgr.debug("Checking width for row %r", row)
         hidden = self.hidden
-        for column in autowidth_columns:
+        wants_changed = False
+        for column, autoval in autowidth_columns.items():
             if hidden[column]:
                 lgr.debug("%r is hidden; setting width to 0",
                           column)
-                autowidth_columns[column]["wants"] = 0
+                if autoval.get("wants") != 0:
+                    wants_changed = True
+                autoval["wants"] = 0
                 continue
 
             field = fields[column]
             lgr.debug("Checking width of column %r (current field width: %d)",
                       column, field.width)
-            # If we've added any style transform functions as pre-format
-            # processors, we want to measure the width of their result rather
-            # than the raw value.
-            if field.pre[proc_group]:
-                value = field(row[column], keys=[proc_group],
-                              exclude_post=True)
+            wmax = autoval["max"]
+            if wmax and field.width >= wmax:
+                # The column can't get any wider, so there's no need to look
+                # at the value.
+                wants = wmax
             else:
-                value = row[column]
-            value = str(value)
-            value_width = len(value)
-            wmax = autowidth_columns[column]["max"]
-            wmin = autowidth_columns[column]["min"]
-            max_seen = max(value_width, field.width)
-            requested_floor = max(max_seen, wmin)
-            wants = min(requested_floor, wmax or requested_floor)
-            lgr.debug("value=%r, value width=%d, old field length=%d, "
-                      "min width=%s, max width=%s => wants=%d",
-                      value, value_width, field.width, wmin, wmax, wants)
-            autowidth_columns[column]["wants"] = wants
+                # If we've added any style transform functions as pre-format
+                # processors, we want to measure the width of their result
+                # rather than the raw value.
+                if field.pre[proc_group]:
+                    value = field(row[column], keys=[proc_group],
+                                  exclude_post=True)
+                else:
+                    value = row[column]
+                if type(value) is not str:
+                    value = str(value)
+                value_width = len(value)
+                wmin = autoval["min"]
+                max_seen = max(value_width, field.width)
+                requested_floor = max(max_seen, wmin)
+                wants = min(requested_floor, wmax or requested_floor)
+                lgr.debug("value=%r, value width=%d, old field length=%d, "
+                          "min width=%s, max width=%s => wants=%d",
+                          value, value_width, field.width, wmin, wmax, wants)
+            if autoval.get("wants") != wants:
+                wants_changed = True
+            autoval["wants"] = wants
+
+        if not wants_changed and width_auto == self._width_auto_assigned:
+            # The widths were assigned from the same input last time.  This is
+            # the common case once the table has settled.
+            return False
 
         # Considering those wants and the available width, assign widths to
         # each column.
         assigned = self._assign_widths(autowidth_columns, width_auto)
+        self._width_auto_assigned = width_auto
 
         # Set the assigned widths.
         adjusted = False
@@ -616,21 +666,63 @@ class StyleFields(object):
         """
         fields = self.fields
         if style is not None:
-            if adopt:
-                style = elements.adopt(self.style, style)
-            elements.validate(style)
-
-            for column in self.columns:
-                fields[column].add(
-                    "pre", "override",
-                    *(self.procgen.pre_from_style(style[column])))
-                fields[column].add(
-                    "post", "override",
-                    *(self.procgen.post_from_style(style[column])))
+            for column, (pre, post) in self._override_procs_for(
+                    style, adopt).items():
+                fields[column].add("pre", "override", *pre)
+                fields[column].add("post", "override", *post)
             return "override"
         else:
             return "default"
 
+    def _override_procs_for(self, style, adopt):
+        """Return the "override" processors for each column of `style`.
+
+        Callers tend to pass the same style repeatedly (e.g., the header style
+        or a row's style on every repaint), so the adopted and validated
+        processors are cached by the contents of `style`.  The cache is reset
+        by `build`.
+
+        Returns
+        -------
+        A dict mapping each column to a tuple of (pre, post) processors.
+        """
+        try:
+            key = elements._structural_key(style), adopt
+            hash(key)
+        except TypeError:
+            # A style value is unhashable.  Don't cache.
+            key = None
+        else:
+            try:
+                return self._override_procs[key]
+            except KeyError:
+                pass
+
+        if adopt:
+            full_style = elements.adopt(self.style, style)
+        else:
+            full_style = style
+        elements.validate(full_style)
+
+        procgen = self.procgen
+        fields = self.fields
+        procs = {}
+        for column in self.columns:
+            if adopt and column not in style:
+                # The column style is unchanged, so reuse the processors that
+                # _setup_fields() built for it.
+                field = fields[column]
+                procs[column] = field.pre["default"], field.post["default"]
+                continue
+            cstyle = full_style[column]
+            procs[column] = (tuple(procgen.pre_from_style(cstyle)),
+                             tuple(procgen.post_from_style(cstyle)))
+        if key is not None:
+            if len(self._override_procs) >= self._max_override_procs:
+                self._override_procs.clear()
+            self._override_procs[key] = procs
+        return procs
+
     def _check_for_unknown_columns(self, row):
         known = self._known_columns
         # The sorted() call here isn't necessary, but it makes testing the
@@ -641,7 +733,8 @@ class StyleFields(object):
         if cols_new:
             raise UnknownColumns(cols_new)
 
-    def render(self, row, style=None, adopt=True, can_unhide=True):
+    def render(self, row, style=None, adopt=True, can_unhide=True,
+               widths_only=False):
         """Render fields with values from `row`.
 
         Parameters
@@ -658,6 +751,9 @@ class StyleFields(object):
         can_unhide : bool, optional
             Whether a non-missing value within `row` is able to unhide a column
             that is marked with "if_missing".
+        widths_only : bool, optional
+            Update the field widths for `row` but don't render the fields.  The
+            rendered value will be None.
 
         Returns
         -------
@@ -688,12 +784,19 @@ class StyleFields(object):
             proc_keys = None
 
         adjusted = self._set_widths(row, group)
-        cols = self.visible_columns
-        proc_fields = ((self.fields[c], row[c]) for c in cols)
-        # Exclude fields that weren't able to claim any width to avoid
-        # surrounding empty values with separators.
-        proc_fields = filter(lambda x: x[0].width > 0, proc_fields)
-        proc_fields = (fld(val, keys=proc_keys) for fld, val in proc_fields)
+        if widths_only:
+            return None, adjusted
+        visible_fields = self._visible_fields
+        if visible_fields is None:
+            fields = self.fields
+            visible_fields = self._visible_fields = [
+                (c, fields[c]) for c in self.visible_columns]
+        proc_fields = []
+        for c, fld in visible_fields:
+            # Exclude fields that weren't able to claim any width to avoid
+            # surrounding empty values with separators.
+            if fld.width > 0:
+                proc_fields.append(fld(row[c], keys=proc_keys))
         return self.style["separator_"].join(proc_fields) + "\n", adjusted
 
 
@@ -766,7 +869,7 @@ class Content(object):
                 self._add_header()
 
     def __len__(self):
-        return len(list(self.rows))
+        return len(self._rows) + bool(self._header)
 
     def __bool__(self):
         return bool(self._rows)
@@ -785,14 +888,16 @@ class Content(object):
             yield i
 
     def _render(self, rows):
-        adjusted = []
+        adjusted = False
         for row, kwds in rows:
-            line, adj = self.fields.render(row, **kwds)
-            yield line
-            # Continue processing so that we get all the adjustments out of
-            # the way.
-            adjusted.append(adj)
-        if any(adjusted):
+            # Continue processing after an adjustment so that we get all the
+            # adjustments out of the way, but there's no need to render the
+            # remaining lines because the caller will discard them.
+            line, adj = self.fields.render(row, widths_only=adjusted, **kwds)
+            if not adjusted:
+                yield line
+            adjusted = adjusted or adj
+        if adjusted:
             raise RedoContent
 
     def __str__(self):
@@ -840,7 +945,7 @@ class Content(object):
                    .format(idx, len(self._idkey_to_idx)))
             raise IndexError(msg) from None
 
-    def update(self, row, style):
+    def update(self, row, style, render=True):
         """Modify the content.
 
         Parameters
@@ -852,6 +957,11 @@ class Content(object):
 
         style :
             Passed to `StyleFields.render`.
+        render : bool, optional
+            Whether to render the content.  If false, the row is recorded and
+            its fields are processed, but the content isn't assembled and
+            (None, None) is returned.  This is useful when the content will
+            only be rendered at the end.
 
         Returns
         -------
@@ -876,6 +986,9 @@ class Content(object):
             self._rows.append(ContentRow(row, kwds={"style": style}))
             self._idkey_to_idx[idkey] = 0
             self._idx_to_idkey[0] = idkey
+            if not render:
+                self.fields.render(row, style)
+                return None, None
             return str(self), "append"
 
         try:
@@ -900,6 +1013,12 @@ class Content(object):
             self._idx_to_idkey[nrows] = idkey
             self._rows.append(ContentRow(row, kwds={"style": style}))
 
+        if not render:
+            # Still run the processors so that an error in, e.g., a
+            # transform function is raised for this row.
+            self.fields.render(row, style)
+            return None, None
+
         line, adjusted = self.fields.render(row, style)
         lgr.log(9, "Rendered line as %r", line)
         if called_before and adjusted:
@@ -932,22 +1051,39 @@ class ContentWithSummary(Content):
             columns, ids, table_width=table_width)
         self.summary = Summary(self.fields.style)
 
-    def update(self, row, style):
-        lgr.log(9, "Updating with .summary set to %s", self.summary)
-        content, status = super(ContentWithSummary, self).update(row, style)
-        if self.summary:
-            summ_rows = self.summary.summarize(
-                self.fields.visible_columns,
-                [r.row for r in self._rows])
-
-            def join():
-                return "".join(self._render(summ_rows))
+    def _render_summary(self):
+        summ_rows = self.summary.summarize(
+            self.fields.visible_columns,
+            [r.row for r in self._rows])
+        return "".join(self._render(summ_rows))
 
+    def update(self, row, style, render=True):
+        lgr.log(9, "Updating with .summary set to %s", self.summary)
+        content, status = super(ContentWithSummary, self).update(
+            row, style, render=render)
+        if self.summary and render:
             try:
-                summ_content = join()
+                summ_content = self._render_summary()
             except RedoContent:
                 # If rendering the summary lines triggered an adjustment, we
                 # need to re-render the main content as well.
-                return str(self), "repaint", join()
+                return str(self), "repaint", self._render_summary()
             return content, status, summ_content
         return content, status, None
+
+    def render(self):
+        """Render the content and summary.
+
+        Returns
+        -------
+        A tuple of (content, summary), where summary is None if there is no
+        summary.
+        """
+        content = str(self)
+        if not (self.summary and self._rows):
+            return content, None
+        try:
+            summ_content = self._render_summary()
+        except RedoContent:
+            return str(self), self._render_summary()
+        return content, summ_content
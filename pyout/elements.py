@@ -4,7 +4,6 @@
 from collections.abc import Mapping
 import functools
 import jsonschema
-import hashlib
 
 
 schema = {
@@ -274,27 +273,46 @@ class StyleValidationError(StyleError):
         super(StyleValidationError, self).__init__(msg)
 
 
-class StrHasher():
-    """A wrapper for objects that hashes based on the string representation.
+def _structural_key(obj):
+    """Return a hashable key for `obj` that compares equal for equal styles.
 
-    Primarily its purpose to provide a customized @StrHasher.lru_cache
-    decorator which allows to cache based on the string representation of the
-    argument of unhashable objects.
+    Mappings are keyed independently of their order, and the type of each
+    value is included so that, e.g., True and 1 are kept apart.
+    """
+    if isinstance(obj, Mapping):
+        return Mapping, frozenset((k, _structural_key(v))
+                                  for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return type(obj), tuple(_structural_key(v) for v in obj)
+    return type(obj), obj
+
+
+class StructureHasher():
+    """A wrapper for objects that hashes based on their structure.
+
+    Primarily its purpose to provide a customized @StructureHasher.lru_cache
+    decorator which allows to cache based on the contents of unhashable
+    objects like dicts.
     """
     def __init__(self, obj):
         self.value = obj
-        self.hash = hashlib.md5(str(obj).encode()).hexdigest()
+        self.key = _structural_key(obj)
+        # Raises TypeError if a leaf value is unhashable.
+        self.hash = hash(self.key)
 
     def __hash__(self):
-        return hash(self.hash)
+        return self.hash
 
     def __eq__(self, other):
-        return self.hash == other.hash
+        return self.key == other.key
 
     @staticmethod
-    def _to(func):
+    def _to(func, uncached_func):
         def cached_func(*args, **kwargs):
-            wrapper = StrHasher((args, kwargs))
+            try:
+                wrapper = StructureHasher((args, kwargs))
+            except TypeError:
+                return uncached_func(*args, **kwargs)
             return func(wrapper)
         return cached_func
 
@@ -318,7 +336,8 @@ class StrHasher():
             # Interface cache operations
             cached_func = functools.wraps(func)(
                 cls._to(
-                    lru_cached_func
+                    lru_cached_func,
+                    func
                 )
             )
             for op in dir(lru_cached_func):
@@ -329,7 +348,7 @@ class StrHasher():
         return decorator
 
 
-@StrHasher.lru_cache()  # the same styles could be checked over again
+@StructureHasher.lru_cache()  # the same styles could be checked over again
 def validate(style):
     """Check `style` against pyout.styling.schema.
 
@@ -352,6 +371,9 @@ def validate(style):
         raise new_exc
 
 
+_MAPPING_VALUE_TYPES = frozenset(["lookup", "re_lookup", "interval"])
+
+
 def value_type(value):
     """Classify `value` of bold, color, and underline keys.
 
@@ -364,9 +386,11 @@ def value_type(value):
     str, {"simple", "lookup", "re_lookup", "interval"}
     """
     try:
-        keys = list(value.keys())
+        keys = value.keys()
     except AttributeError:
         return "simple"
-    if keys in [["lookup"], ["re_lookup"], ["interval"]]:
-        return keys[0]
+    if len(keys) == 1:
+        key, = keys
+        if key in _MAPPING_VALUE_TYPES:
+            return key
     raise ValueError("Type of `value` could not be determined")
@@ -56,10 +56,15 @@ class Field(object):
         `pre` and `post` are a list of functions that form a pipeline, but they
         are structured as a dict of lists to allow different processors to be
         grouped by key.  By specifying keys, the caller can control which
-        groups are "enabled".
+        groups are "enabled".  Use the `add` method to modify these so that
+        the cached pipelines are invalidated.
     """
 
     _align_values = {"left": "<", "right": ">", "center": "^"}
+    # Maximum number of rendered values to keep for each set of keys.
+    _max_rendered = 1024
+    # Types of values whose rendered result can be reused.
+    _cacheable_types = frozenset([str, int, bool])
 
     def __init__(self, width=10, align="left",
                  default_keys=None, other_keys=None):
@@ -72,6 +77,9 @@ class Field(object):
 
         self.pre = defaultdict(list)
         self.post = defaultdict(list)
+        # (keys, exclude_post) => (list of processors, including _format,
+        #                          {(type, value) => rendered value} or None)
+        self._pipelines = {}
 
     def _check_if_registered(self, key):
         if key not in self.registered_keys:
@@ -100,7 +108,9 @@ class Field(object):
         else:
             raise ValueError("kind is not 'pre' or 'post'")
         self._check_if_registered(key)
-        procs[key] = values
+        if procs.get(key) != values:
+            procs[key] = values
+            self._pipelines.clear()
 
     @property
     def width(self):
@@ -110,15 +120,25 @@ class Field(object):
     def width(self, value):
         self._width = value
         self._fmt = self._build_format()
+        self._pipelines.clear()
 
     def _build_format(self):
+        """Return a function that pads a string to the field's width.
+        """
         align = self._align_values[self._align]
-        return "".join(["{:", align, str(self.width), "}"])
+        width = self.width
+        if align == "<":
+            return lambda text: text.ljust(width)
+        elif align == ">":
+            return lambda text: text.rjust(width)
+        # str.center() doesn't always split odd padding the way str.format()
+        # does, so keep using format() for centered fields.
+        return "".join(["{:", align, str(width), "}"]).format
 
     def _format(self, _, result):
         """Wrap format call as a two-argument processor function.
         """
-        return self._fmt.format(str(result))
+        return self._fmt(str(result))
 
     def __call__(self, value, keys=None, exclude_post=False):
         """Render `value` by feeding it through the processors.
@@ -140,6 +160,46 @@ class Field(object):
                   self.default_keys)
         if keys is None:
             keys = self.default_keys
+        funcs, rendered = self._pipeline(keys, exclude_post)
+        if len(funcs) == 1 and type(value) is str and \
+           len(value) == self._width:
+            # Only the format step would run, and it has nothing to pad.
+            # Don't cache these values; they are often unique (e.g., IDs).
+            return value
+        # Values often repeat across rows and the whole table is re-rendered
+        # when a width changes, so reuse the result for a value that has
+        # already been rendered with these processors.  Only do so for types
+        # whose equal values always print the same (unlike, e.g.,
+        # Decimal("1.0") and Decimal("1.00")).  The type is part of the key so
+        # that True and 1 aren't treated as the same value.
+        value_type = type(value)
+        if rendered is not None and value_type in self._cacheable_types:
+            cache_key = value_type, value
+            try:
+                return rendered[cache_key]
+            except KeyError:
+                pass
+        else:
+            cache_key = None
+
+        result = value
+        for fn in funcs:
+            result = fn(value, result)
+        if cache_key is not None:
+            if len(rendered) >= self._max_rendered:
+                rendered.clear()
+            rendered[cache_key] = result
+        return result
+
+    def _pipeline(self, keys, exclude_post):
+        """Return the processors to call for `keys` and their rendered values.
+        """
+        cache_key = (tuple(keys), exclude_post)
+        try:
+            return self._pipelines[cache_key]
+        except KeyError:
+            pass
+
         for key in keys:
             self._check_if_registered(key)
 
@@ -149,11 +209,17 @@ class Field(object):
         else:
             post_funcs = chain(*(self.post[k] for k in keys))
 
-        funcs = chain(pre_funcs, [self._format], post_funcs)
-        result = value
-        for fn in funcs:
-            result = fn(value, result)
-        return result
+        funcs = list(chain(pre_funcs, [self._format], post_funcs))
+        # Don't reuse results from processors that call a user's function
+        # (e.g., a "transform"), which may not return the same result for the
+        # same value.
+        if all(getattr(fn, "cacheable", True) for fn in funcs):
+            rendered = {}
+        else:
+            rendered = None
+        pipeline = funcs, rendered
+        self._pipelines[cache_key] = pipeline
+        return pipeline
 
 
 class Nothing(object):
@@ -194,6 +260,7 @@ def _pass_nothing_through(proc):
     """
     def wrapped(value, result):
         return result if isinstance(value, Nothing) else proc(value, result)
+    wrapped.cacheable = getattr(proc, "cacheable", True)
     return wrapped
 
 
@@ -257,6 +324,8 @@ class StyleProcessors(object):
                     # Remove circular reference.
                     # https://docs.python.org/2/library/sys.html#sys.exc_info
                     del tb
+        # See Field._pipeline.
+        transform_fn.cacheable = False
         return transform_fn
 
     def by_key(self, style_key, style_value):
@@ -377,7 +446,11 @@ class StyleProcessors(object):
         A function.
         """
         style_attr = style_key if self.style_types[style_key] is bool else None
-        intervals = style_value["interval"]
+        # Resolve open ends once rather than for each value.
+        intervals = [(float("-inf") if start is None else start,
+                      float("inf") if end is None else end,
+                      lookup_value)
+                     for start, end, lookup_value in style_value["interval"]]
 
         def proc(value, result):
             try:
@@ -387,11 +460,6 @@ class StyleProcessors(object):
                 return result
 
             for start, end, lookup_value in intervals:
-                if start is None:
-                    start = float("-inf")
-                if end is None:
-                    end = float("inf")
-
                 if start <= value < end:
                     if not lookup_value:
                         return result
@@ -429,14 +497,12 @@ class StyleProcessors(object):
         -------
         A generator object.
         """
-        flanks = Flanks()
-        yield flanks.split_flanks
-
         fns = {"simple": self.by_key,
                "lookup": self.by_lookup,
                "re_lookup": self.by_re_lookup,
                "interval": self.by_interval_lookup}
 
+        procs = []
         for key in self.style_types:
             if key not in column_style:
                 continue
@@ -447,8 +513,17 @@ class StyleProcessors(object):
             if vtype == "re_lookup":
                 args.append(sum(getattr(re, f)
                                 for f in column_style.get("re_flags", [])))
-            yield _pass_nothing_through(fn(*args))
+            procs.append(_pass_nothing_through(fn(*args)))
+
+        if not procs:
+            # There's nothing to style, so don't bother splitting off and
+            # rejoining the flanking whitespace.
+            return
 
+        flanks = Flanks()
+        yield flanks.split_flanks
+        for proc in procs:
+            yield proc
         yield flanks.join_flanks
 
 
@@ -505,6 +580,8 @@ class TermProcessors(StyleProcessors):
 
     def __init__(self, term):
         self.term = term
+        self._normal = str(term.normal)
+        self._codes = {}  # style attribute => terminal code
 
     def render(self, style_attr, value):
         """Prepend terminal code for `key` to `value`.
@@ -525,19 +602,46 @@ class TermProcessors(StyleProcessors):
             # We've got an empty string.  Don't bother adding any
             # codes.
             return value
-        return str(getattr(self.term, style_attr)) + value
+        try:
+            code = self._codes[style_attr]
+        except KeyError:
+            code = str(getattr(self.term, style_attr))
+            self._codes[style_attr] = code
+        return code + value
 
     def _maybe_reset(self):
+        normal = self._normal
+
         def proc(_, result):
-            if "\x1b" in result:
-                return result + self.term.normal
+            if "\x1b" in result and not result.endswith(normal):
+                return result + normal
             return result
         return proc
 
+    def _maybe_reset_flanked(self):
+        flanks = Flanks()
+        reset = self._maybe_reset()
+
+        def proc(_, result):
+            if "\x1b" not in result:
+                return result
+            return flanks.join_flanks(
+                _, reset(_, flanks.split_flanks(_, result)))
+        return proc
+
     def post_from_style(self, column_style):
         """A Terminal-specific reset to StyleProcessors.post_from_style.
         """
-        for proc in super(TermProcessors, self).post_from_style(column_style):
+        procs = list(
+            super(TermProcessors, self).post_from_style(column_style))
+        if not procs:
+            # The column isn't styled, but the value may contain its own
+            # codes.  Reset those before the padding, but skip splitting off
+            # the whitespace for the common case of a value without codes.
+            yield self._maybe_reset_flanked()
+            return
+
+        for proc in procs:
             if proc.__name__ == "join_flanks":
                 # Reset any codes before adding back whitespace.
                 yield self._maybe_reset()
@@ -29,6 +29,9 @@ lgr = getLogger(__name__)
 class Stream(object, metaclass=abc.ABCMeta):
     """Output stream interface used by Writer.
 
+    Output is held until `flush` is called and then written to the
+    underlying stream at once.
+
     Parameters
     ----------
     stream : stream, optional
@@ -53,6 +56,7 @@ class Stream(object, metaclass=abc.ABCMeta):
         else:
             self.interactive = interactive
         self.supports_updates = self.interactive
+        self._pending = []
 
     @abc.abstractproperty
     def width(self):
@@ -63,10 +67,10 @@ class Stream(object, metaclass=abc.ABCMeta):
     def height(self):
         """Maximum number of rows that are visible."""
 
-    @abc.abstractmethod
     def write(self, text):
         """Write `text`.
         """
+        self._pending.append(text)
 
     @abc.abstractmethod
     def clear_last_lines(self, n):
@@ -83,6 +87,35 @@ class Stream(object, metaclass=abc.ABCMeta):
         """Move the Nth previous line.
         """
 
+    def flush(self, force=False):
+        """Flush any buffered output.
+
+        Writers call this at the end of a logical group of writes (e.g., after
+        a row has been written) rather than after each `write` call.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Flush the underlying stream even if it isn't interactive.  By
+            default, a non-interactive stream (e.g., a pipe or a file) is
+            left to its own buffering.
+        """
+        pending, self._pending = self._pending, []
+        if pending:
+            self.stream.write("".join(pending))
+        if force or self.interactive:
+            self.stream.flush()
+
+
+def _split_lines(text):
+    """Split `text` into a list of newline-terminated lines.
+
+    None is returned if `text` does not end with a newline.
+    """
+    if not text.endswith("\n"):
+        return None
+    return [line + "\n" for line in text.split("\n")[:-1]]
+
 
 def skip_if_aborted(method):
     """Decorate Writer `method` to prevent execution if write has been aborted.
@@ -114,6 +147,9 @@ class Writer(object):
         self._ids = None
 
         self._last_content_len = 0
+        # The lines of content currently displayed (in "update" mode), or None
+        # if they can't be tracked (e.g., a value contains a newline).
+        self._last_content_lines = []
         self._last_summary = None
         self._normalizer = None
 
@@ -125,6 +161,11 @@ class Writer(object):
             max_workers = min(32, (os.cpu_count() or 1) + 4)
         self._max_workers = max_workers
         self._lock = None
+        # Asynchronous results that are waiting for the write lock.
+        self._pending_results = []
+        self._pending_lock = threading.Lock()
+        # Rows written within outside_write(), or None outside of it.
+        self._outside_write_rows = None
         self._aborted = False
         self._futures = defaultdict(list)
         self._continue_on_failure = continue_on_failure
@@ -216,10 +257,14 @@ class Writer(object):
                 raise
 
         if self._mode == "final":
-            self._stream.write(str(self._content))
+            # Rows were only recorded as they came in (see _write_final).
+            content, self._last_summary = self._content.render()
+            self._stream.write(content)
         if self._mode != "update" and self._last_summary is not None:
             self._stream.write(str(self._last_summary))
 
+        self._stream.flush(force=True)
+
         if failed:
             self._print_async_exceptions(failed)
 
@@ -281,6 +326,7 @@ class Writer(object):
                     stream.write(
                         "Producing value for row {} failed:\n{}\n"
                         .format(id_key, traceback.format_exc()))
+            stream.flush()
 
     @skip_if_aborted
     def _abort(self, cause=None, msg=None):
@@ -301,6 +347,7 @@ class Writer(object):
         stream.write("Canceled pending asynchronous workers. "
                      "{} worker{} already running\n"
                      .format(n_running, "" if n_running == 1 else "s"))
+        stream.flush()
         # Note: We can't call shutdown() with wait=True here.  That will
         # trigger a RuntimeError in underlying <thread>.join() call.
         self._pool.shutdown(wait=False)
@@ -345,20 +392,57 @@ class Writer(object):
 
     def _write(self, row, style=None):
         with self._write_lock():
-            if self._width_from_stream and self._mode != "final":
-                width_current = self._content.fields.style["width_"]
-                width_stream = self._stream.width
-                if width_stream is not None and width_current != width_stream:
-                    lgr.debug("Current stream width (%d) different "
-                              "than last recorded (%d). Updating",
-                              width_stream, width_current)
-                    self._init_prewrite(table_width=width_stream)
+            if self._outside_write_rows is not None:
+                # Don't write over the caller's output.  The row is written
+                # when outside_write() exits.
+                self._outside_write_rows.append((row, style))
+                return
             try:
-                self._write_fn(row, style)
-            except UnknownColumns as exc:
-                self._columns.extend(exc.unknown_columns)
-                self._init_prewrite()
-                self._write_fn(row, style, redo=True)
+                self._write_row(row, style)
+            finally:
+                self._stream.flush()
+
+    def _write_row(self, row, style=None):
+        if self._width_from_stream and self._mode != "final":
+            width_current = self._content.fields.style["width_"]
+            width_stream = self._stream.width
+            if width_stream is not None and width_current != width_stream:
+                lgr.debug("Current stream width (%d) different "
+                          "than last recorded (%d). Updating",
+                          width_stream, width_current)
+                self._init_prewrite(table_width=width_stream)
+        try:
+            self._write_fn(row, style)
+        except UnknownColumns as exc:
+            self._columns.extend(exc.unknown_columns)
+            self._init_prewrite()
+            self._write_fn(row, style, redo=True)
+
+    def _write_pending_results(self):
+        """Write the asynchronous results that have queued up.
+
+        Results that arrive while another thread holds the write lock are
+        written together by whichever thread gets the lock next, with a single
+        flush at the end.  An error from writing a result doesn't keep the
+        rest from being written.  It's recorded for the result's own worker,
+        which raises it (see _write_async_result).
+        """
+        with self._write_lock():
+            with self._pending_lock:
+                pending = self._pending_results
+                self._pending_results = []
+            if not pending:
+                # Another thread already took care of them.
+                return
+            lgr.debug("Writing %d pending result(s)", len(pending))
+            try:
+                for result, errors in pending:
+                    try:
+                        self._write_row(result)
+                    except Exception as exc:
+                        errors.append(exc)
+            finally:
+                self._stream.flush()
 
     def _get_last_summary_length(self):
         last_summary = self._last_summary
@@ -394,14 +478,28 @@ class Writer(object):
                           n_back, status, row)
                 self._stream.overwrite_line(n_back, content)
                 single_row_updated = True
+                lines = self._last_content_lines
+                new_lines = _split_lines(content)
+                if lines is not None and new_lines is not None and \
+                   len(new_lines) == 1:
+                    lines[status] = new_lines[0]
+                else:
+                    self._last_content_lines = None
 
         if not single_row_updated:
             if status == "repaint":
                 lgr.debug("Moving up %d line(s) to repaint the whole thing. "
                           "Blame row %r",
                           self._last_content_len, row)
-                self._stream.move_to(self._last_content_len)
-            self._stream.write(content)
+                self._repaint(content, last_summary_len)
+            else:
+                self._stream.write(content)
+                lines = self._last_content_lines
+                new_lines = _split_lines(content)
+                if lines is not None and new_lines is not None:
+                    lines.extend(new_lines)
+                else:
+                    self._last_content_lines = None
 
         if summary is not None:
             self._stream.write(summary)
@@ -409,6 +507,41 @@ class Writer(object):
         self._last_content_len = len(self._content)
         self._last_summary = summary
 
+    def _repaint(self, content, last_summary_len):
+        """Move to the first line of the content and write `content`.
+
+        If all the previously written lines are visible, lines that haven't
+        changed are skipped over rather than written again.
+        """
+        self._stream.move_to(self._last_content_len)
+
+        old_lines = self._last_content_lines
+        new_lines = _split_lines(content)
+        self._last_content_lines = new_lines
+        n_visible = self._stream.height - last_summary_len - 1
+        # The line-wise comparison is only meaningful if there is one line per
+        # row, and skipping over lines only works if all are still visible.
+        if old_lines is None or new_lines is None or \
+           len(old_lines) != self._last_content_len or \
+           len(new_lines) != len(self._content) or \
+           len(old_lines) > n_visible:
+            self._stream.write(content)
+            return
+
+        parts = []
+        n_skip = 0
+        for idx, line in enumerate(new_lines):
+            if idx < len(old_lines) and old_lines[idx] == line:
+                n_skip += 1
+                continue
+            if n_skip:
+                parts.append("\n" * n_skip)
+                n_skip = 0
+            parts.append(line)
+        if n_skip:
+            parts.append("\n" * n_skip)
+        self._stream.write("".join(parts))
+
     def _write_incremental(self, row, style=None, redo=False):
         content, status, summary = self._content.update(row, style)
         if isinstance(status, int):
@@ -419,14 +552,15 @@ class Writer(object):
         self._last_summary = summary
 
     def _write_final(self, row, style=None, redo=False):
-        _, _, summary = self._content.update(row, style)
-        self._last_summary = summary
+        # Nothing is written until __exit__, so there's no need to assemble
+        # the content or summary for each row.
+        self._content.update(row, style, render=False)
 
     @skip_if_aborted
     def _write_async_result(self, id_vals, cols, result):
         lgr.debug("Received result for %s: %s",
                   cols, result)
-        if isinstance(result, Mapping):
+        if isinstance(result, dict) or isinstance(result, Mapping):
             lgr.debug("Processing result as mapping")
         elif isinstance(result, tuple):
             lgr.debug("Processing result as tuple")
@@ -439,7 +573,56 @@ class Writer(object):
                 "Expected tuple or mapping for columns {!r}, got {!r}"
                 .format(cols, result))
         result.update(id_vals)
-        self._write(result)
+        errors = []
+        with self._pending_lock:
+            self._pending_results.append((result, errors))
+        # Once this returns, the result has been written, either by this
+        # thread or by the one that held the write lock.
+        self._write_pending_results()
+        if errors:
+            raise errors[0]
+
+    def _check_async_result(self, future):
+        if future.cancelled():
+            ok = False
+        elif future.exception():
+            ok = False
+            if not self._continue_on_failure:
+                self._abort(cause=future)
+        else:
+            ok = True
+        return ok
+
+    def _wrap_callable(self, id_vals, cols, fn):
+        """Return the function to submit for `fn` and its done callback.
+
+        This is a separate method rather than inlined in the loop of
+        _start_callables() so that each returned function is bound to its own
+        `cols` and generator instead of the last ones seen by the loop.
+        """
+        gen = None
+        if inspect.isgeneratorfunction(fn):
+            gen = fn()
+        elif inspect.isgenerator(fn):
+            gen = fn
+
+        if gen:
+            lgr.debug("Wrapping generator for cols %r of row %r",
+                      cols, id_vals)
+
+            def async_fn():
+                for i in gen:
+                    self._write_async_result(id_vals, cols, i)
+
+            callback = self._check_async_result
+        else:
+            async_fn = fn
+
+            def callback(future):
+                if self._check_async_result(future):
+                    self._write_async_result(
+                        id_vals, cols, future.result())
+        return async_fn, callback
 
     @skip_if_aborted
     def _start_callables(self, row, callables):
@@ -454,43 +637,12 @@ class Writer(object):
             self._pool = Pool(max_workers=self._max_workers)
         if self._lock is None:
             lgr.debug("Initializing lock")
-            self._lock = threading.Lock()
+            # Use a reentrant lock so that a thread that already holds it
+            # (e.g., within outside_write()) can still call the writer.
+            self._lock = threading.RLock()
 
         for cols, fn in callables:
-            gen = None
-            if inspect.isgeneratorfunction(fn):
-                gen = fn()
-            elif inspect.isgenerator(fn):
-                gen = fn
-
-            def check_result(future):
-                if future.cancelled():
-                    ok = False
-                elif future.exception():
-                    ok = False
-                    if not self._continue_on_failure:
-                        self._abort(cause=future)
-                else:
-                    ok = True
-                return ok
-
-            if gen:
-                lgr.debug("Wrapping generator for cols %r of row %r",
-                          cols, id_vals)
-
-                def async_fn():
-                    for i in gen:
-                        self._write_async_result(id_vals, cols, i)
-
-                callback = check_result
-            else:
-                async_fn = fn
-
-                def callback(future):
-                    if check_result(future):
-                        self._write_async_result(
-                            id_vals, cols, future.result())
-
+            async_fn, callback = self._wrap_callable(id_vals, cols, fn)
             try:
                 future = self._pool.submit(async_fn)
             except RuntimeError as exc:
@@ -679,6 +831,7 @@ class Writer(object):
 
         This context manager allows callers to interrupt the table output while
         writing their own output.  On exit, the entire table is rewritten.
+        Rows written within the context are held until then.
 
         Parameters
         ----------
@@ -694,9 +847,21 @@ class Writer(object):
                     self._stream.height - 1,
                     self._last_content_len + self._get_last_summary_length())
                 self._stream.clear_last_lines(n_lines)
-            yield
+            self._stream.flush()
+            self._outside_write_rows = rows = []
+            try:
+                yield
+            finally:
+                self._outside_write_rows = None
             if update:
-                self._stream.write(str(self._content))
+                content = str(self._content)
+                self._stream.write(content)
+                self._last_content_lines = _split_lines(content)
                 last_summary = self._last_summary
                 if last_summary:
                     self._stream.write(last_summary)
+            try:
+                for row, style in rows:
+                    self._write_row(row, style)
+            finally:
+                self._stream.flush()
@@ -3,7 +3,6 @@
 This module defines the Tabular entry point.
 """
 
-from contextlib import contextmanager
 from logging import getLogger
 import os
 
@@ -30,6 +29,13 @@ class TerminalStream(interface.Stream):
         self.term = Terminal(stream=self.stream,
                              # interactive=False maps to force_styling=None.
                              force_styling=self.interactive or None)
+        # Look up the capabilities once rather than going through
+        # Terminal.__getattr__ for each write.
+        term = self.term
+        self._move_up = str(term.move_up)
+        self._move_down = str(term.move_down)
+        self._clear_eol = str(term.clear_eol)
+        self._clear_eos = str(term.clear_eos)
 
     @property
     def width(self):
@@ -45,37 +51,21 @@ class TerminalStream(interface.Stream):
         if self.interactive:
             return self.term.height
 
-    def write(self, text):
-        """Write `text` to terminal.
-        """
-        self.term.stream.write(text)
-
     def clear_last_lines(self, n):
         """Clear last N lines of terminal output.
         """
-        self.term.stream.write(
-            self.term.move_up * n + self.term.clear_eos)
-        self.term.stream.flush()
-
-    @contextmanager
-    def _moveback(self, n):
-        self.term.stream.write(self.term.move_up * n + self.term.clear_eol)
-        try:
-            yield
-        finally:
-            self.term.stream.write(self.term.move_down * (n - 1))
-            self.term.stream.flush()
+        self.write(self._move_up * n + self._clear_eos)
 
     def overwrite_line(self, n, text):
         """Move back N lines and overwrite line with `text`.
         """
-        with self._moveback(n):
-            self.term.stream.write(text)
+        self.write("".join([self._move_up * n, self._clear_eol, text,
+                            self._move_down * (n - 1)]))
 
     def move_to(self, n):
         """Move back N lines in terminal.
         """
-        self.term.stream.write(self.term.move_up * n)
+        self.write(self._move_up * n)
 
 
 class Tabular(interface.Writer):
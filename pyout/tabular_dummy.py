@@ -24,18 +24,10 @@ class NoUpdateTerminalStream(interface.Stream):
     move_to = _die
 
     # Height and width are the fallback defaults of py3's
-    # shutil.get_terminal_size().
-
-    @property
-    def width(self):
-        return 80
-
-    @property
-    def height(self):
-        return 24
-
-    def write(self, text):
-        self.stream.write(text)
+    # shutil.get_terminal_size().  They are constant, so plain class
+    # attributes are enough to override the abstract properties.
+    width = 80
+    height = 24
 
 
 class Tabular(interface.Writer):
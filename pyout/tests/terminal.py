@@ -3,7 +3,7 @@
 
 from curses import tigetstr
 from curses import tparm
-from functools import partial
+from functools import lru_cache
 import re
 
 # Eventually we may want to retire blessings:
@@ -41,14 +41,17 @@ class Terminal(bls.Terminal):
         self._height = value
 
 
-# unicode_cap, and unicode_parm are copied from blessings' tests.
+# unicode_cap, and unicode_parm are copied from blessings' tests.  They are
+# cached because the tests look up the same few capabilities many times.
 
 
+@lru_cache(maxsize=None)
 def unicode_cap(cap):
     """Return the result of ``tigetstr`` except as Unicode."""
     return tigetstr(cap).decode('latin1')
 
 
+@lru_cache(maxsize=None)
 def unicode_parm(cap, *params):
     """Return the result of ``tparm(tigetstr())`` except as Unicode."""
     return tparm(tigetstr(cap), *params).decode('latin1')
@@ -61,20 +64,42 @@ COLORNUMS = {"black": 0, "red": 1, "green": 2, "yellow": 3, "blue": 4,
 def capres(name, value):
     """Format value with CAP key, followed by a reset.
     """
-    if name in COLORNUMS:
-        prefix = unicode_parm("setaf", COLORNUMS[name])
+    num = COLORNUMS.get(name)
+    if num is not None:
+        prefix = unicode_parm("setaf", num)
     else:
         prefix = unicode_cap(name)
     return prefix + value + unicode_cap("sgr0")
 
 
+@lru_cache(maxsize=None)
+def _clear_codes_re():
+    # This can't be done at import time because tigetstr() needs setupterm()
+    # to have been called, which happens when a Terminal is created.
+    clear_codes = [re.escape(unicode_cap(x)) for x in ["el", "ed", "cuu1"]]
+    return re.compile("(?:{}|{}|{})*(.*)".format(*clear_codes))
+
+
+def _strip_clear_codes(text):
+    match = _clear_codes_re().match(text)
+    assert match, "This should always match"
+    return match.group(1)
+
+
 def eq_repr_noclear(actual, expected):
     """Like `eq_repr`, but strip clear-related codes from `actual`.
     """
-    clear_codes = [re.escape(unicode_cap(x)) for x in ["el", "ed", "cuu1"]]
-    match = re.match("(?:{}|{}|{})*(.*)".format(*clear_codes), actual)
-    assert match, "This should always match"
-    return repr(match.group(1)) == repr(expected)
+    return _strip_clear_codes(actual) == expected
 
 
-assert_contains_nc = partial(assert_contains, cmp=eq_repr_noclear)
+def assert_contains_nc(collection, *items, **kwargs):
+    """Like `assert_contains`, but compare with `eq_repr_noclear`.
+    """
+    # Strip each element once rather than once per item.
+    try:
+        assert_contains([_strip_clear_codes(x) for x in collection],
+                        *items, **kwargs)
+    except AssertionError as exc:
+        # Show the original elements too; the codes help with debugging.
+        raise AssertionError(
+            "{}\n\nOriginal elements: {!r}".format(exc, collection)) from None
@@ -47,6 +47,16 @@ def test_adopt():
             assert newstyle[key] == value
 
 
+def test_adopt_copies_unchanged_mappings():
+    default_value = {"align": "<", "width": 10}
+    style = {"name": default_value, "path": default_value}
+
+    newstyle = adopt(style, {"path": {"width": 99}})
+    newstyle["name"]["width"] = 5
+    assert default_value == {"align": "<", "width": 10}
+    assert newstyle["path"]["width"] == 99
+
+
 def test_validate_error():
     # With caching we want to ensure that we do not cache the error
     # somehow and do raise it again
@@ -69,6 +79,22 @@ def test_validate_ok():
         mock_validate.assert_called_once()
 
 
+def test_validate_cache_key():
+    with mock.patch("jsonschema.validate") as mock_validate:
+        validate({"a": {"bold": True}, "b": {"width": 3}})
+        # The order of the keys doesn't matter...
+        validate({"b": {"width": 3}, "a": {"bold": True}})
+        mock_validate.assert_called_once()
+        # ... but the type of the values does.
+        validate({"a": {"bold": 1}, "b": {"width": 3}})
+        assert mock_validate.call_count == 2
+
+        # Styles with unhashable values are validated every time.
+        for _ in range(2):
+            validate({"a": {"bold": {"lookup": {"x": {True}}}}})
+        assert mock_validate.call_count == 4
+
+
 def test_value_type():
     assert value_type(True) == "simple"
     assert value_type("red") == "simple"
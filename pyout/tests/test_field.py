@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from decimal import Decimal
+
 import pytest
 
 from pyout.field import Field
@@ -9,12 +11,16 @@ from pyout.field import StyleProcessors
 def test_field_base():
     assert Field()("ok") == "ok        "
     assert Field(width=5, align="right")("ok") == "   ok"
+    assert Field(width=3, align="center")("ok") == "ok "
 
 
 def test_field_update():
     field = Field()
     field.width = 2
     assert field("ok") == "ok"
+    assert field("no") == "no"
+    # Values that already fit aren't kept around.
+    assert not any(rendered for _, rendered in field._pipelines.values())
 
 
 def test_field_processors():
@@ -40,6 +46,71 @@ def test_field_processors():
         field.add("pre", "not registered key")
 
 
+def test_field_processors_replaced():
+    def post(_, result):
+        return "<" + result + ">"
+
+    field = Field(width=4, default_keys=["default"], other_keys=["override"])
+    assert field("ok") == "ok  "
+    field.add("post", "default", post)
+    assert field("ok") == "<ok  >"
+    assert field("ok", keys=["override"]) == "ok  "
+    assert field("ok", exclude_post=True) == "ok  "
+    field.width = 3
+    assert field("ok") == "<ok >"
+
+    with pytest.raises(ValueError):
+        field("ok", keys=["not registered key"])
+
+
+def test_field_rendered_values_reused():
+    calls = []
+
+    def pre(value, result):
+        calls.append(value)
+        return result
+
+    field = Field(width=4, default_keys=["default"])
+    field.add("pre", "default", pre)
+    assert field("ok") == "ok  "
+    assert field("ok") == "ok  "
+    assert calls == ["ok"]
+
+    assert field(1) == "1   "
+    assert field(True) == "True"
+    assert calls == ["ok", 1, True]
+
+    assert field(["a"]) == "['a']"
+    assert field(["a"]) == "['a']"
+    assert calls == ["ok", 1, True, ["a"], ["a"]]
+
+    field.width = 3
+    assert field("ok") == "ok "
+    assert calls == ["ok", 1, True, ["a"], ["a"], "ok"]
+
+
+def test_field_rendered_values_equal_but_different():
+    field = Field(width=4, default_keys=["default"])
+    field.add("pre", "default", lambda _, result: result)
+    assert field(Decimal("1.0")) == "1.0 "
+    assert field(Decimal("1.00")) == "1.00"
+    assert field(0.0) == "0.0 "
+    assert field(-0.0) == "-0.0"
+
+
+def test_field_rendered_values_transform_not_reused():
+    counter = iter(range(10))
+
+    def transform(value):
+        return "{}{}".format(value, next(counter))
+
+    field = Field(width=4, default_keys=["default"])
+    field.add("pre", "default", StyleProcessors.transform(transform))
+    # A transform isn't assumed to return the same result for a value.
+    assert field("ok") == "ok0 "
+    assert field("ok") == "ok1 "
+
+
 @pytest.mark.parametrize("text",
                          ["", "-", "…"],
                          ids=["text=''", "text='-'", "text='…'"])
@@ -57,3 +128,9 @@ def test_style_processor_render():
     sp = StyleProcessors()
     with pytest.raises(NotImplementedError):
         sp.render("key", "value")
+
+
+def test_style_processor_post_from_style_unstyled():
+    sp = StyleProcessors()
+    assert list(sp.post_from_style({"align": "left"})) == []
+    assert len(list(sp.post_from_style({"bold": True}))) == 3
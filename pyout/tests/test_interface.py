@@ -7,7 +7,9 @@ try:
 except pytest.skip.Exception:
     pytest.importorskip("blessings")
 
+from io import StringIO
 import inspect
+from unittest import mock
 
 from pyout.interface import Stream
 from pyout.interface import Writer
@@ -29,3 +31,30 @@ def test_writer_children_match_signature(writer):
                          ids=["terminal", "noupdate"])
 def test_stream_children_match_signature(stream):
     assert inspect.signature(stream) == inspect.signature(Stream)
+
+
+@pytest.mark.parametrize("stream_cls",
+                         [TerminalStream, NoUpdateTerminalStream],
+                         ids=["terminal", "noupdate"])
+def test_stream_write_on_flush(stream_cls):
+    out = StringIO()
+    stream = stream_cls(stream=out, interactive=False)
+    stream.write("foo\n")
+    stream.write("bar\n")
+    assert out.getvalue() == ""
+    stream.flush()
+    assert out.getvalue() == "foo\nbar\n"
+
+
+@pytest.mark.parametrize("interactive", [True, False],
+                         ids=["interactive", "noninteractive"])
+def test_stream_flush_underlying(interactive):
+    out = StringIO()
+    stream = NoUpdateTerminalStream(stream=out, interactive=interactive)
+    with mock.patch.object(out, "flush") as flush:
+        stream.write("foo\n")
+        stream.flush()
+        assert out.getvalue() == "foo\n"
+        assert flush.called == interactive
+        stream.flush(force=True)
+        assert flush.called
@@ -11,10 +11,10 @@ except pytest.skip.Exception:
 from collections import Counter
 from collections import OrderedDict
 import logging
-import sys
 import time
 import threading
-import traceback
+from types import SimpleNamespace
+from unittest import mock
 
 from pyout.common import ContentError
 from pyout.elements import StyleError
@@ -25,10 +25,11 @@ from pyout.tests.terminal import assert_contains_nc
 from pyout.tests.terminal import capres
 from pyout.tests.terminal import eq_repr_noclear
 from pyout.tests.terminal import unicode_cap
+from pyout.tests.utils import assert_contains
 from pyout.tests.utils import assert_eq_repr
 
 
-class AttrData(object):
+class AttrData(SimpleNamespace):
     """Store `kwargs` as attributes.
 
     For testing tabular calls to construct row's data from an objects
@@ -37,9 +38,6 @@ class AttrData(object):
     This doesn't use __getattr__ to map dict keys to attributes because then
     we'd have to handle a KeyError for the "missing" column tests.
     """
-    def __init__(self, **kwargs):
-        for attr, value in kwargs.items():
-            setattr(self, attr, value)
 
 
 def test_tabular_write_color():
@@ -52,6 +50,15 @@ def test_tabular_write_color():
     assert_eq_repr(out.stdout, expected)
 
 
+def test_tabular_write_escape_codes_unstyled():
+    out = Tabular(["name", "status"],
+                  style={"name": {"width": 9}})
+    out({"name": "\x1b[31mred", "status": "ok"})
+    # The value's own code is reset before the padding.
+    expected = "\x1b[31mred" + str(out._stream.term.normal) + "  ok\n"
+    assert_eq_repr(out.stdout, expected)
+
+
 def test_tabular_write_empty_string():
     out = Tabular()
     out({"name": ""})
@@ -331,6 +338,45 @@ def test_tabular_write_style_override():
     assert_eq_repr(out.stdout, expected)
 
 
+def test_tabular_write_style_override_reused():
+    out = Tabular(["name"],
+                  style={"name": {"color": "green", "width": 3}})
+    style = {"name": {"color": "black", "width": 3}}
+    out({"name": "foo"}, style=style)
+    with mock.patch("pyout.elements.validate") as mock_validate:
+        out({"name": "bar"}, style=style)
+        out({"name": "baz"}, style=style)
+    # The adopted style was validated by the first call and isn't validated
+    # again when the same style is passed.
+    mock_validate.assert_not_called()
+
+    term = out._stream.term
+    expected = "".join(str(term.black) + name + str(term.normal) + "\n"
+                       for name in ["foo", "bar", "baz"])
+    assert_eq_repr(out.stdout, expected)
+
+
+def test_tabular_write_style_override_mutated():
+    out = Tabular(["name"], style={"name": {"width": 3}})
+    style = {"name": {"color": "red", "width": 3}}
+    out({"name": "foo"}, style=style)
+    style["name"]["color"] = "green"
+    out({"name": "bar"}, style=style)
+
+    term = out._stream.term
+    expected = (str(term.red) + "foo" + str(term.normal) + "\n" +
+                str(term.green) + "bar" + str(term.normal) + "\n")
+    assert_eq_repr(out.stdout, expected)
+
+
+def test_tabular_write_style_override_cache_bounded():
+    out = Tabular(["name"], style={"name": {"width": 3}})
+    fields = out._content.fields
+    for i in range(fields._max_override_procs + 10):
+        out({"name": "foo"}, style={"name": {"missing": str(i)}})
+    assert len(fields._override_procs) <= fields._max_override_procs
+
+
 def test_tabular_default_style():
     out = Tabular(["name", "status"],
                   style={"default_": {"width": 3}})
@@ -492,45 +538,23 @@ def test_tabular_content_get_idkey():
         out._content.get_idkey(4)
 
 
-def test_tabular_write_lookup_color():
+@pytest.mark.parametrize("key,lookup_value,cap",
+                         [("color", "red", "red"),
+                          ("bold", True, "bold"),
+                          ("bold", False, None)],
+                         ids=["color", "bold", "bold_false"])
+def test_tabular_write_lookup(key, lookup_value, cap):
     out = Tabular(style={"name": {"width": 3},
-                         "status": {"color": {"lookup": {"BAD": "red"}},
+                         "status": {key: {"lookup": {"BAD": lookup_value}},
                                     "width": 6}})
     out(OrderedDict([("name", "foo"),
                      ("status", "OK")]))
     out(OrderedDict([("name", "bar"),
                      ("status", "BAD")]))
 
+    bad = capres(cap, "BAD") if cap else "BAD"
     expected = "foo " + "OK    \n" + \
-               "bar " + capres("red", "BAD") + "   \n"
-    assert_eq_repr(out.stdout, expected)
-
-
-def test_tabular_write_lookup_bold():
-    out = Tabular(style={"name": {"width": 3},
-                         "status": {"bold": {"lookup": {"BAD": True}},
-                                    "width": 6}})
-    out(OrderedDict([("name", "foo"),
-                     ("status", "OK")]))
-    out(OrderedDict([("name", "bar"),
-                     ("status", "BAD")]))
-
-    expected = "foo " + "OK    \n" + \
-               "bar " + capres("bold", "BAD") + "   \n"
-    assert_eq_repr(out.stdout, expected)
-
-
-def test_tabular_write_lookup_bold_false():
-    out = Tabular(style={"name": {"width": 3},
-                         "status": {"bold": {"lookup": {"BAD": False}},
-                                    "width": 6}})
-    out(OrderedDict([("name", "foo"),
-                     ("status", "OK")]))
-    out(OrderedDict([("name", "bar"),
-                     ("status", "BAD")]))
-
-    expected = ("foo OK    \n"
-                "bar BAD   \n")
+               "bar " + bad + "   \n"
     assert_eq_repr(out.stdout, expected)
 
 
@@ -602,66 +626,34 @@ def test_tabular_write_intervals_wrong_type():
     assert_contains_nc(out.stdout.splitlines(), *expected)
 
 
-def test_tabular_write_intervals_color():
+@pytest.mark.parametrize("intervals,cap88,cap33",
+                         [([[0, 50, "red"],
+                            [50, 80, "yellow"],
+                            [80, 100, "green"]],
+                           "green", "red"),
+                          ([[None, 50, "red"],
+                            [80, None, "green"]],
+                           "green", "red"),
+                          ([[None, None, "red"]],
+                           "red", "red"),
+                          ([[0, 50, "red"]],
+                           None, "red")],
+                         ids=["closed", "open_ended", "catchall_range",
+                              "outside_intervals"])
+def test_tabular_write_intervals_color(intervals, cap88, cap33):
     out = Tabular(style={"name": {"width": 3},
-                         "percent": {"color": {"interval":
-                                               [[0, 50, "red"],
-                                                [50, 80, "yellow"],
-                                                [80, 100, "green"]]},
-                                     "width": 7}})
-    out(OrderedDict([("name", "foo"),
-                     ("percent", 88)]))
-    out(OrderedDict([("name", "bar"),
-                     ("percent", 33)]))
-
-    expected = "foo " + capres("green", "88") + "     \n" + \
-               "bar " + capres("red", "33") + "     \n"
-    assert_eq_repr(out.stdout, expected)
-
-
-def test_tabular_write_intervals_color_open_ended():
-    out = Tabular(style={"name": {"width": 3},
-                         "percent": {"color": {"interval":
-                                               [[None, 50, "red"],
-                                                [80, None, "green"]]},
-                                     "width": 7}})
-    out(OrderedDict([("name", "foo"),
-                     ("percent", 88)]))
-    out(OrderedDict([("name", "bar"),
-                     ("percent", 33)]))
-
-    expected = "foo " + capres("green", "88") + "     \n" + \
-               "bar " + capres("red", "33") + "     \n"
-    assert_eq_repr(out.stdout, expected)
-
-
-def test_tabular_write_intervals_color_catchall_range():
-    out = Tabular(style={"name": {"width": 3},
-                         "percent": {"color": {"interval":
-                                               [[None, None, "red"]]},
+                         "percent": {"color": {"interval": intervals},
                                      "width": 7}})
     out(OrderedDict([("name", "foo"),
                      ("percent", 88)]))
     out(OrderedDict([("name", "bar"),
                      ("percent", 33)]))
 
-    expected = "foo " + capres("red", "88") + "     \n" + \
-               "bar " + capres("red", "33") + "     \n"
-    assert_eq_repr(out.stdout, expected)
-
+    def render(cap, value):
+        return capres(cap, value) if cap else value
 
-def test_tabular_write_intervals_color_outside_intervals():
-    out = Tabular(style={"name": {"width": 3},
-                         "percent": {"color": {"interval":
-                                               [[0, 50, "red"]]},
-                                     "width": 7}})
-    out(OrderedDict([("name", "foo"),
-                     ("percent", 88)]))
-    out(OrderedDict([("name", "bar"),
-                     ("percent", 33)]))
-
-    expected = "foo 88     \n" + \
-               "bar " + capres("red", "33") + "     \n"
+    expected = "foo " + render(cap88, "88") + "     \n" + \
+               "bar " + render(cap33, "33") + "     \n"
     assert_eq_repr(out.stdout, expected)
 
 
@@ -757,16 +749,23 @@ def test_tabular_write_transform_func_error():
                          "val": {"transform": dontlikeints}})
     # The transform function receives the data as given, so it fails trying to
     # index an integer.
-    try:
+    with pytest.raises(StyleFunctionError) as excinfo:
+        out(OrderedDict([("name", "foo"), ("val", 330)]))
+    assert "dontlikeints" in [entry.name for entry in excinfo.traceback]
+
+
+def test_tabular_write_transform_func_error_mode_final():
+    def dontlikeints(x):
+        return x[::-1]
+
+    out = Tabular(style={"name": {"width": 4},
+                         "val": {"transform": dontlikeints, "width": 5}},
+                  mode="final")
+    # The error is raised for the offending row rather than when the content
+    # is rendered at the end.  (With a fixed width, the value isn't processed
+    # to measure its width.)
+    with pytest.raises(StyleFunctionError):
         out(OrderedDict([("name", "foo"), ("val", 330)]))
-    except:
-        exc_type, value, tb = sys.exc_info()
-        try:
-            assert isinstance(value, StyleFunctionError)
-            names = [x[2] for x in traceback.extract_tb(tb)]
-            assert "dontlikeints" in names
-        finally:
-            del tb
 
 
 def test_tabular_write_width_truncate_long():
@@ -797,6 +796,33 @@ def test_tabular_write_autowidth():
     assert_contains_nc(lines, "bar   BAD /tmp/b", "fooab OK  /tmp/a")
 
 
+def test_tabular_write_autowidth_settled():
+    out = Tabular(["name", "status"],
+                  style={"status": {"width": {"max": 4}}})
+    out({"name": "fooab", "status": "OK"})
+    out({"name": "bar", "status": "UNKNOWN"})
+
+    fields = out._content.fields
+    with mock.patch.object(fields, "_assign_widths",
+                           wraps=fields._assign_widths) as assign:
+        # Nothing wants more width than the previous rows, ...
+        out({"name": "baz", "status": "OK"})
+        assign.assert_not_called()
+        # ... including a value that is truncated to the column maximum.
+        out({"name": "qux", "status": "TOOLONG"})
+        assign.assert_not_called()
+        out({"name": "foobar", "status": "OK"})
+        assign.assert_called_once()
+
+    lines = out.stdout.splitlines()
+    assert_contains_nc(lines,
+                       "fooab  OK  ",
+                       "bar    U...",
+                       "baz    OK  ",
+                       "qux    T...",
+                       "foobar OK  ")
+
+
 def test_tabular_write_autowidth_with_header():
     out = Tabular(style={"header_": {},
                          "name": {"width": "auto"},
@@ -1035,23 +1061,45 @@ def test_tabular_width_change_mode_final():
     assert out.stdout.strip() == "a xxxxxxxxxxxxxxxxxxxx"
 
 
+def test_tabular_repaint_skips_unchanged_lines():
+    out = Tabular(["name", "status"])
+    out({"name": "a", "status": "x"})
+    # A change in width triggers a repaint, but the first line is the same.
+    out.change_term_width(50)
+    out({"name": "b", "status": "y"})
+    assert_eq_repr(out.stdout,
+                   "a x\n" + unicode_cap("cuu1") + "\n" + "b y\n")
+
+
 class Delayed(object):
     """Helper for producing a delayed callable.
     """
 
     def __init__(self, value):
         self.value = value
-        self.now = False
+        self._now = threading.Event()
+
+    @property
+    def now(self):
+        return self._now.is_set()
+
+    @now.setter
+    def now(self, value):
+        if value:
+            self._now.set()
+        else:
+            self._now.clear()
 
     def run(self):
         """Return `value` once `now` is true.
         """
-        while True:
-            if self.now:
-                value = self.value
-                if callable(value):
-                    value = value()
-                return value
+        # Block rather than spin so that the worker doesn't compete with the
+        # threads that are writing the table.
+        self._now.wait()
+        value = self.value
+        if callable(value):
+            value = value()
+        return value
 
     def gen(self):
         value = self.run()
@@ -1105,6 +1153,127 @@ def test_tabular_write_callable_values():
     assert_contains_nc(lines, "foo done    ", "baz over    ")
 
 
+@pytest.mark.timeout(10)
+def test_tabular_write_callable_values_several_in_row():
+    delay_status = Delayed("done")
+    delay_path = Delayed("/tmp/a")
+
+    out = Tabular(["name", "status", "path"])
+    with out:
+        out({"name": "foo", "status": delay_status.run,
+             "path": delay_path.gen})
+        delay_status.now = True
+        delay_path.now = True
+    lines = out.stdout.splitlines()
+    assert_contains_nc(lines, "foo done /tmp/a")
+
+
+@pytest.mark.timeout(10)
+def test_tabular_write_within_outside_write():
+    delay = Delayed("done")
+    out = Tabular(["name", "status"])
+    with out:
+        out({"name": "foo", "status": delay.run})
+        # The write lock is held within outside_write(), but it can be
+        # reacquired by the same thread.  The row isn't written until the
+        # caller is done with its own output.
+        with out.outside_write():
+            out({"name": "bar", "status": "ok"})
+            out._stream.write("outside\n")
+        delay.now = True
+    lines = out.stdout.splitlines()
+    assert "outside" in lines
+    assert_contains_nc(lines, "foo done", "bar ok  ")
+    outside_idx = lines.index("outside")
+    assert not any("bar" in line for line in lines[:outside_idx])
+    # Nothing moves the cursor back over the caller's output.
+    for n_after, line in enumerate(lines[outside_idx + 1:]):
+        assert line.count(out._stream.term.move_up) <= n_after
+
+
+def _queue_results_within_outside_write(out, release, n_results):
+    """Call `release` while `out` holds the write lock.
+
+    `release` should let workers produce `n_results` results, all of which are
+    queued before any of them are written.
+    """
+    write_pending = out._write_pending_results
+    all_queued = threading.Event()
+    nqueued = []
+
+    def write_pending_wrapped():
+        # Each result is queued before its worker gets here.
+        nqueued.append(1)
+        if len(nqueued) == n_results:
+            all_queued.set()
+        write_pending()
+
+    with mock.patch.object(out, "_write_pending_results",
+                           side_effect=write_pending_wrapped):
+        with out.outside_write():
+            release()
+            # The results wait for the lock held by outside_write().
+            assert all_queued.wait(timeout=5)
+
+
+@pytest.mark.timeout(10)
+def test_tabular_write_callable_results_batched():
+    delay_status = Delayed("done")
+    delay_path = Delayed("/tmp/a")
+
+    out = Tabular(["name", "status", "path"])
+    with mock.patch.object(out, "_write_row",
+                           wraps=out._write_row) as write_row:
+        with out:
+            out({"name": "foo", "status": delay_status.run,
+                 "path": delay_path.run})
+            write_row.reset_mock()
+
+            def release():
+                delay_status.now = True
+                delay_path.now = True
+
+            _queue_results_within_outside_write(out, release, 2)
+    # Each result is still written on its own.
+    assert write_row.call_count == 2
+    assert_contains([c[0][0] for c in write_row.call_args_list],
+                    {"name": "foo", "status": "done"},
+                    {"name": "foo", "path": "/tmp/a"})
+    lines = out.stdout.splitlines()
+    assert_contains_nc(lines, "foo done /tmp/a")
+
+
+@pytest.mark.timeout(10)
+def test_tabular_write_callable_results_batched_error():
+    def dontlikebad(x):
+        if x == "bad":
+            raise ValueError("bad value")
+        return x
+
+    gate = threading.Event()
+    out = Tabular(["name", "status"],
+                  style={"status": {"transform": dontlikebad}},
+                  continue_on_failure=True)
+    with out:
+        # A generator's values are written within its worker, so an error
+        # goes to the worker's future.
+        out({"name": "foo", "status": delayed_gen_func("done", gate=gate)})
+        out({"name": "bar", "status": delayed_gen_func("bad", gate=gate)})
+        out({"name": "baz", "status": delayed_gen_func("done", gate=gate)})
+        try:
+            _queue_results_within_outside_write(out, gate.set, 3)
+        finally:
+            gate.set()
+    stdout = out.stdout
+    # The failure belongs to bar's worker, whichever thread wrote the result,
+    # and the other results in the batch are still written.
+    assert "ERROR: 1 asynchronous worker failed" in stdout
+    assert "Producing value for row ('bar',) failed" in stdout
+    assert "bad value" in stdout
+    lines = stdout.splitlines()
+    assert_contains_nc(lines, "foo done", "baz done")
+
+
 @pytest.mark.timeout(10)
 def test_tabular_write_callable_transform_nothing():
     delay0 = Delayed(3)
@@ -1241,11 +1410,15 @@ def test_tabular_callback_to_offscreen_row(nrows):
         nexpected_plain = 0
         nexpected_updated = 1
 
-    assert len([ln for ln in lines if ln == "foo03 OK "]) == nexpected_plain
-
     cuu1 = unicode_cap("cuu1")
-    updated = [l for l in lines if l.startswith(cuu1) and "foo03 OK " in l]
-    assert len(updated) == nexpected_updated
+    nplain = nupdated = 0
+    for ln in lines:
+        if ln == "foo03 OK ":
+            nplain += 1
+        elif ln.startswith(cuu1) and "foo03 OK " in ln:
+            nupdated += 1
+    assert nplain == nexpected_plain
+    assert nupdated == nexpected_updated
 
 
 @pytest.mark.timeout(10)
@@ -1563,30 +1736,38 @@ def test_tabular_pool_shutdown():
             out({"name": "baz", "status": delay_2.run})
 
 
-def delayed_gen_func(*values):
+def delayed_gen_func(*values, gate):
+    """Return a generator function that yields `values` once `gate` is set.
+    """
     if not values:
         values = ["update", "finished"]
 
     def fn():
+        # Don't block the worker forever if the test never sets the gate.
+        gate.wait(timeout=5)
         for val in values:
-            time.sleep(0.05)
             yield val
     return fn
 
 
 @pytest.mark.timeout(10)
-@pytest.mark.parametrize("gen_source",
-                         [delayed_gen_func(),
-                          delayed_gen_func()()],
+@pytest.mark.parametrize("as_generator", [False, True],
                          ids=["gen_func", "generator"])
-def test_tabular_write_generator_function_values(gen_source):
+def test_tabular_write_generator_function_values(as_generator):
+    gate = threading.Event()
+    gen_source = delayed_gen_func(gate=gate)
+    if as_generator:
+        gen_source = gen_source()
     with Tabular(["name", "status"]) as out:
-        out({"name": "foo", "status": ("waiting", gen_source)})
-        out({"name": "bar", "status": "ok"})
+        try:
+            out({"name": "foo", "status": ("waiting", gen_source)})
+            out({"name": "bar", "status": "ok"})
 
-        expected = ("foo waiting\n"
-                    "bar ok     \n")
-        assert_eq_repr(out.stdout, expected)
+            expected = ("foo waiting\n"
+                        "bar ok     \n")
+            assert_eq_repr(out.stdout, expected)
+        finally:
+            gate.set()
     lines = out.stdout.splitlines()
     assert_contains_nc(lines,
                        "foo update ",
@@ -1596,21 +1777,26 @@ def test_tabular_write_generator_function_values(gen_source):
 
 @pytest.mark.timeout(10)
 def test_tabular_write_generator_values_multireturn():
+    gate = threading.Event()
     gen = delayed_gen_func({"status": "working"},  # for one of two columns
                            {"path": "/tmp/a"},  # for the other of two columns
                            {"path": "/tmp/b",  # for both columns
-                            "status": "done"})
+                            "status": "done"},
+                           gate=gate)
     out = Tabular()
     with out:
-        out(OrderedDict([("name", "foo"),
-                         (("status", "path"), ("...", gen))]))
-        out(OrderedDict([("name", "bar"),
-                         ("status", "ok"),
-                         ("path", "na")]))
-
-        expected = ("foo ... ...\n"
-                    "bar ok  na \n")
-        assert_eq_repr(out.stdout, expected)
+        try:
+            out(OrderedDict([("name", "foo"),
+                             (("status", "path"), ("...", gen))]))
+            out(OrderedDict([("name", "bar"),
+                             ("status", "ok"),
+                             ("path", "na")]))
+
+            expected = ("foo ... ...\n"
+                        "bar ok  na \n")
+            assert_eq_repr(out.stdout, expected)
+        finally:
+            gate.set()
     lines = out.stdout.splitlines()
     assert_contains_nc(lines,
                        "foo working ...",
@@ -1654,10 +1840,10 @@ def test_tabular_write_delayed(form):
 
     # Either paired0/paired1 came in first or solo came in first, but
     # paired0/paired1 should arrive together.
-    firstin = [ln for ln in lines
-               if eq_repr_noclear(ln, "foo 1 2")
-               or eq_repr_noclear(ln, "foo 3")]
-    assert len(firstin) == 1
+    nfirstin = sum(1 for ln in lines
+                   if eq_repr_noclear(ln, "foo 1 2")
+                   or eq_repr_noclear(ln, "foo 3"))
+    assert nfirstin == 1
 
     assert eq_repr_noclear(lines[-1], "foo 1 2 3")
 
@@ -1760,7 +1946,7 @@ def test_tabular_shrinking_summary():
     lines = out.stdout.splitlines()
     # Two summary lines shrank to one, so we expect two move-ups and a clear.
     expected = unicode_cap("cuu1") * 2 + unicode_cap("ed")
-    assert len([ln for ln in lines if ln.startswith(expected)]) == 1
+    assert sum(ln.startswith(expected) for ln in lines) == 1
 
 
 def test_tabular_summary_avoid_repeated_clear():
@@ -1822,8 +2008,13 @@ def test_tabular_mode_incremental():
     assert len(lines) == 5
 
 
-def test_tabular_mode_final():
-    out = Tabular(["name", "status"], mode="final")
+@pytest.mark.parametrize("style,nlines",
+                         # Two regular rows, plus one summary if requested.
+                         [({}, 2),
+                          ({"status": {"aggregate": len}}, 3)],
+                         ids=["no summary", "summary"])
+def test_tabular_mode_final(style, nlines):
+    out = Tabular(["name", "status"], style=style, mode="final")
 
     with out:
         out({"name": "foo", "status": "unknown"})
@@ -1831,23 +2022,25 @@ def test_tabular_mode_final():
         out({"name": "foo", "status": "ok"})
 
     assert "unknown" not in out.stdout
-    assert len(out.stdout.splitlines()) == 2
+    assert len(out.stdout.splitlines()) == nlines
 
 
-def test_tabular_mode_final_summary():
+def test_tabular_mode_final_summary_once():
+    agg = mock.Mock(side_effect=len)
     out = Tabular(["name", "status"],
-                  style={"status": {"aggregate": len}},
+                  style={"status": {"aggregate": agg}},
                   mode="final")
 
     with out:
         out({"name": "foo", "status": "unknown"})
         out({"name": "bar", "status": "ok"})
         out({"name": "foo", "status": "ok"})
+        assert out.stdout == ""
 
-    assert "unknown" not in out.stdout
-    lines = out.stdout.splitlines()
-    # Expect three lines, two regular rows and one summary.
-    assert len(lines) == 3
+    # The summary is only computed for the output at the end.
+    agg.assert_called_once_with(["ok", "ok"])
+    assert_contains_nc(out.stdout.splitlines(),
+                       "foo ok     ", "bar ok     ", "    2      ")
 
 
 @pytest.mark.parametrize("clear", [True, False])
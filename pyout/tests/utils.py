@@ -31,4 +31,7 @@ def assert_contains(collection, *items, **kwargs):
 def assert_eq_repr(a, b):
     """Compare the repr's of `a` and `b` to escape escape codes.
     """
+    if type(a) is str and type(b) is str and a == b:
+        # Equal strings have equal repr's, so don't bother building them.
+        return
     assert repr(a) == repr(b)
@@ -17,9 +17,20 @@ def _truncate_right(value, length, marker):
 
 
 def _truncate_left(value, length, marker):
-    res = _truncate_right(value[::-1], length,
-                          marker[::-1] if marker else None)
-    return res[::-1]
+    # Mirror _truncate_right by slicing from the end rather than reversing
+    # the value and marker.
+    value_len = len(value)
+    if value_len <= length:
+        short = value
+    elif marker:
+        nchars_free = length - len(marker)
+        if nchars_free > 0:
+            short = marker + value[value_len - nchars_free:]
+        else:
+            short = marker[len(marker) - length:]
+    else:
+        short = value[value_len - length:]
+    return short
 
 
 def _splice(value, n):
@@ -101,4 +112,10 @@ class Truncater(object):
             raise ValueError("Unrecognized `where` value: {}".format(where))
 
     def truncate(self, _, result):
-        return self._truncate_fn(result, self.length, self.marker)
+        length = self.length
+        if len(result) <= length:
+            # This is the common case because the result is usually padded to
+            # the field width.  Return early so that, e.g., _truncate_left()
+            # doesn't reverse the string twice.
+            return result
+        return self._truncate_fn(result, length, self.marker)